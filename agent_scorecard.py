@@ -1,53 +1,189 @@
 # agent_scorecard.py
-import json, os
+import json, os, atexit, functools
 
-scorecard_path = "agent_scorecard.json"
+scorecard_path = "agent_scorecard.json"   # compacted snapshot of the scorecard
+wal_path = "agent_scorecard.jsonl"        # append-only log of outcomes recorded since the snapshot
+COMPACT_EVERY_EVENTS = 10000              # fold the log into the snapshot after this many events
 
-# Initialize scorecard file if not present
-if not os.path.exists(scorecard_path):
-    initial_data = {}
-    with open(scorecard_path, 'w') as f:
-        json.dump(initial_data, f)
+score_log_path = "logs/agent_scorecard.log"
 
-# Load current scorecard data (structure: {agent: {"success": int, "failure": int, "enabled": bool}})
-with open(scorecard_path, 'r') as f:
-    scorecard = json.load(f)
+_wal = None        # long-lived append handle, opened on first use
+_wal_events = 0    # events appended since the last snapshot
+_generation = 0    # compactions folded into the snapshot (names the rotated log of each compaction)
+_score_log = None  # long-lived handle for agent_scorecard.log, opened on the first disable event
+
+class AgentScore:
+    """Outcome counters for one agent. __slots__ keeps per-event updates to plain attribute stores
+    instead of nested dict lookups, and keeps the per-agent footprint small."""
+    __slots__ = ("success", "failure", "enabled")
+
+    def __init__(self, success=0, failure=0, enabled=True):
+        self.success = success
+        self.failure = failure
+        self.enabled = enabled
+
+    def as_dict(self):
+        return {"success": self.success, "failure": self.failure, "enabled": self.enabled}
+
+def _apply_event(scorecard, event):
+    """Apply a single log event to the in-memory scorecard.
+    Events are {"a": agent, "r": 1|0} for a success/failure, or {"a": agent, "e": bool} for an enabled change."""
+    agent_name = event["a"]
+    score = scorecard.get(agent_name)
+    if score is None:
+        score = scorecard[agent_name] = AgentScore()
+    if "r" in event:
+        if event["r"]:
+            score.success += 1
+        else:
+            score.failure += 1
+    if "e" in event:
+        score.enabled = event["e"]
+
+def _rotated_wal_path(generation):
+    """Path the event log is moved to while compaction number `generation` writes its snapshot."""
+    return f"{wal_path}.{generation}"
+
+def _replay(scorecard, path):
+    """Apply every event logged in `path` to the scorecard; returns the number of events applied."""
+    applied = 0
+    with open(path, 'rb') as f:
+        for line in f:
+            try:
+                _apply_event(scorecard, json.loads(line))
+            except (ValueError, KeyError):
+                continue  # skip a torn or malformed trailing line
+            applied += 1
+    return applied
+
+@functools.lru_cache(maxsize=1)
+def _load_scorecard():
+    """Load the scorecard on first use (snapshot structure: {"generation": int, "agents": {agent: {"success": int,
+    "failure": int, "enabled": bool}}}; a plain {agent: ...} snapshot from older versions is generation 0).
+    The snapshot is read, outcomes logged since it was taken are replayed, and the log is opened for appending."""
+    global _wal, _wal_events, _generation
+    # Initialize scorecard file if not present
+    if not os.path.exists(scorecard_path):
+        _write_snapshot({}, 0)
+
+    with open(scorecard_path, 'r') as f:
+        snapshot = json.load(f)
+    if "generation" in snapshot and isinstance(snapshot.get("agents"), dict):
+        _generation = snapshot["generation"]
+        snapshot = snapshot["agents"]
+    scorecard = {
+        name: AgentScore(data.get("success", 0), data.get("failure", 0), data.get("enabled", True))
+        for name, data in snapshot.items()
+    }
+
+    # Finish a compaction interrupted after it rotated the log (see `_compact`)
+    if os.path.exists(_rotated_wal_path(_generation)):
+        # Its snapshot was published, so the rotated log is already folded in
+        os.remove(_rotated_wal_path(_generation))
+    pending_rotated = _rotated_wal_path(_generation + 1)
+    if os.path.exists(pending_rotated):
+        # Its snapshot was not published: fold the rotated log in now
+        _replay(scorecard, pending_rotated)
+        _write_snapshot(scorecard, _generation + 1)
+        _generation += 1
+        os.remove(pending_rotated)
+
+    # Replay outcomes logged since the last snapshot to rebuild the current state
+    if os.path.exists(wal_path):
+        _wal_events = _replay(scorecard, wal_path)
+
+    _wal = open(wal_path, 'ab', buffering=65536)
+    atexit.register(_close_at_exit)
+    return scorecard
+
+def get_scorecard():
+    """Return a snapshot of the scorecard as plain dicts ({agent: {"success", "failure", "enabled"}})."""
+    return {name: score.as_dict() for name, score in _load_scorecard().items()}
+
+def _write_snapshot(scorecard, generation, pretty=False):
+    """Atomically replace the snapshot with `scorecard` ({agent: AgentScore}) as of compaction `generation`."""
+    tmp_path = scorecard_path + ".tmp"
+    snapshot = {"generation": generation, "agents": {name: score.as_dict() for name, score in scorecard.items()}}
+    with open(tmp_path, 'w') as f:
+        if pretty:
+            json.dump(snapshot, f, indent=2)
+        else:
+            json.dump(snapshot, f, separators=(',', ':'))
+    os.replace(tmp_path, scorecard_path)
+
+def _compact(pretty=False):
+    """Write the in-memory scorecard as the new snapshot and start a new event log.
+    The log is first moved aside under the new generation, so a crash at any point either leaves the old
+    snapshot plus that rotated log, or the new snapshot (whose generation says the rotated log is folded in)."""
+    global _wal, _wal_events, _generation
+    generation = _generation + 1
+    rotated_path = _rotated_wal_path(generation)
+    _wal.close()
+    os.replace(wal_path, rotated_path)
+    _wal = open(wal_path, 'ab', buffering=65536)
+    _write_snapshot(_load_scorecard(), generation, pretty)
+    _generation = generation
+    _wal_events = 0
+    os.remove(rotated_path)
+
+def _append_event(event):
+    """Append one compact event line to the log, compacting periodically."""
+    global _wal_events
+    _wal.write(json.dumps(event, separators=(',', ':')).encode('utf-8') + b"\n")
+    _wal_events += 1
+    if _wal_events >= COMPACT_EVERY_EVENTS:
+        _compact()
+
+def _close_at_exit():
+    """Fold pending events into a pretty-printed snapshot and close the log when the process shuts down."""
+    if _wal_events:
+        _compact(pretty=True)
+    _wal.close()
+
+def _get_score_log():
+    """Return the persistent agent_scorecard.log handle, opening it on first use."""
+    global _score_log
+    if _score_log is None:
+        _score_log = open(score_log_path, 'a', buffering=1 << 14)
+        atexit.register(_score_log.close)
+    return _score_log
 
 def record_success(agent_name):
     """Record a successful outcome for the given agent."""
-    if agent_name not in scorecard:
-        scorecard[agent_name] = {"success": 0, "failure": 0, "enabled": True}
-    scorecard[agent_name]["success"] += 1
+    scorecard = _load_scorecard()
+    score = scorecard.get(agent_name)
+    if score is None:
+        score = scorecard[agent_name] = AgentScore()
+    score.success += 1
+    _append_event({"a": agent_name, "r": 1})
     _evaluate_agent(agent_name)
 
 def record_failure(agent_name):
     """Record a failed outcome for the given agent."""
-    if agent_name not in scorecard:
-        scorecard[agent_name] = {"success": 0, "failure": 0, "enabled": True}
-    scorecard[agent_name]["failure"] += 1
+    scorecard = _load_scorecard()
+    score = scorecard.get(agent_name)
+    if score is None:
+        score = scorecard[agent_name] = AgentScore()
+    score.failure += 1
+    _append_event({"a": agent_name, "r": 0})
     _evaluate_agent(agent_name)
 
 def _evaluate_agent(agent_name):
     """Evaluate the performance of the agent and disable it if below threshold."""
-    data = scorecard[agent_name]
-    total = data["success"] + data["failure"]
+    data = _load_scorecard()[agent_name]
+    if not data.enabled:
+        # Already disabled; agents are never auto-re-enabled, so there is nothing to evaluate
+        return
+    total = data.success + data.failure
     if total >= 5:  # only evaluate after at least 5 attempts to avoid premature disabling
-        success_rate = data["success"] / total
-        if success_rate < 0.5 and data["enabled"]:
+        success_rate = data.success / total
+        if success_rate < 0.5:
             # Disable the agent for poor performance
-            scorecard[agent_name]["enabled"] = False
+            data.enabled = False
+            _append_event({"a": agent_name, "e": False})
             # Log the disabling event
-            with open("logs/agent_scorecard.log", 'a') as logf:
-                logf.write(f"Agent {agent_name} disabled - success rate {success_rate*100:.1f}% (success: {data['success']}, failure: {data['failure']})\n")
+            _get_score_log().write(f"Agent {agent_name} disabled - success rate {success_rate*100:.1f}% (success: {data.success}, failure: {data.failure})\n")
             # Optionally, trigger an event or notify the system (handled elsewhere, e.g., Meta-Learning Observer)
-        elif success_rate >= 0.5 and not data["enabled"]:
-            # If performance improved (perhaps agent was re-enabled manually), keep it disabled until manual intervention
-            # (We don't auto-reenable in this design without human review)
-            pass
-
-    # Save the updated scorecard to file for persistence
-    with open(scorecard_path, 'w') as f:
-        json.dump(scorecard, f, indent=2)
 
 # Example usage: (In practice, these functions would be called by the system when an agent completes a task)
 if __name__ == "__main__":
@@ -58,4 +194,4 @@ if __name__ == "__main__":
     record_failure("main")
     record_failure("main")
     record_failure("main")  # after multiple failures, "main" might be disabled if it was the failing one
-    print("Scorecard:", scorecard)
+    print("Scorecard:", get_scorecard())
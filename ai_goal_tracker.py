@@ -1,5 +1,5 @@
 # ai_goal_tracker.py
-import os, json, datetime
+import os, io, json, mmap, struct, atexit, datetime, functools
 
 # Define mission objectives (could also be loaded from a config file for easier adjustment)
 objectives = {
@@ -8,46 +8,103 @@ objectives = {
     "user_signups": 100       # target new user sign-ups per month
 }
 
-# Path to metrics storage
+# Path to metrics storage: a fixed-layout binary file updated in place through mmap,
+# exported to JSON for human consumption on each report
+metrics_state_file = "current_metrics.bin"
 metrics_file = "current_metrics.json"
-# If metrics file doesn't exist, initialize it
-if not os.path.exists(metrics_file):
-    # Initialize metrics for the current month with zeros
-    initial_data = {
-        "month": datetime.date.today().strftime("%Y-%m"),
-        "content_produced": 0,
-        "revenue": 0,
-        "user_signups": 0
+
+# Layout (little-endian, 31 bytes): month "YYYY-MM" | content_produced int64 | revenue float64 | user_signups int64
+_MONTH = slice(0, 7)
+_CONTENT_OFFSET = 7
+_REVENUE_OFFSET = 15
+_SIGNUPS_OFFSET = 23
+_STATE_SIZE = 31
+
+def _current_month():
+    # Fixed-format f-string avoids strftime's locale machinery
+    today = datetime.date.today()
+    return f"{today.year:04d}-{today.month:02d}".encode("ascii")
+
+def _reset(mm, month):
+    mm[_MONTH] = month
+    struct.pack_into("<qdq", mm, _CONTENT_OFFSET, 0, 0.0, 0)
+
+@functools.lru_cache(maxsize=1)
+def _open_metrics():
+    """Map the metrics state file on first use, creating it (seeded from current_metrics.json if present)."""
+    if not os.path.exists(metrics_state_file) or os.path.getsize(metrics_state_file) != _STATE_SIZE:
+        seed = {}
+        if os.path.exists(metrics_file):
+            with open(metrics_file, 'r') as f:
+                seed = json.load(f)
+        data = bytearray(_STATE_SIZE)
+        month = str(seed.get("month", "")).encode("ascii")
+        if len(month) == 7:
+            data[_MONTH] = month
+            struct.pack_into("<qdq", data, _CONTENT_OFFSET,
+                             int(seed.get("content_produced", 0)), float(seed.get("revenue", 0)), int(seed.get("user_signups", 0)))
+        with open(metrics_state_file, 'wb') as f:
+            f.write(data)
+
+    f = open(metrics_state_file, 'r+b')
+    # ACCESS_WRITE rather than prot=PROT_WRITE keeps this portable to Windows
+    mm = mmap.mmap(f.fileno(), _STATE_SIZE, access=mmap.ACCESS_WRITE)
+    f.close()
+    atexit.register(mm.close)  # closing flushes dirty pages back to the file
+    return mm
+
+def _metrics_map():
+    """Return the mapped state, resetting the counters if a new month has started."""
+    mm = _open_metrics()
+    month = _current_month()
+    if mm[_MONTH] != month:
+        _reset(mm, month)
+    return mm
+
+def increment_content(count=1):
+    """Record produced content pieces for the current month."""
+    mm = _metrics_map()
+    struct.pack_into("<q", mm, _CONTENT_OFFSET, struct.unpack_from("<q", mm, _CONTENT_OFFSET)[0] + count)
+
+def add_revenue(amount):
+    """Add revenue (USD) for the current month."""
+    mm = _metrics_map()
+    struct.pack_into("<d", mm, _REVENUE_OFFSET, struct.unpack_from("<d", mm, _REVENUE_OFFSET)[0] + amount)
+
+def add_signups(count=1):
+    """Record new user sign-ups for the current month."""
+    mm = _metrics_map()
+    struct.pack_into("<q", mm, _SIGNUPS_OFFSET, struct.unpack_from("<q", mm, _SIGNUPS_OFFSET)[0] + count)
+
+def get_metrics():
+    """Return the current month's metrics as a dict."""
+    mm = _metrics_map()
+    content, revenue, signups = struct.unpack_from("<qdq", mm, _CONTENT_OFFSET)
+    return {
+        "month": mm[_MONTH].decode("ascii"),
+        "content_produced": content,
+        "revenue": revenue,
+        "user_signups": signups
     }
+
+def export_metrics_json(metrics=None):
+    """Write the metrics to current_metrics.json for people and tools that read it."""
     with open(metrics_file, 'w') as f:
-        json.dump(initial_data, f, indent=2)
-
-# Load current metrics
-with open(metrics_file, 'r') as f:
-    metrics = json.load(f)
-
-current_month = datetime.date.today().strftime("%Y-%m")
-if metrics.get("month") != current_month:
-    # If a new month has started, reset counts for the new month
-    metrics = {
-        "month": current_month,
-        "content_produced": 0,
-        "revenue": 0,
-        "user_signups": 0
-    }
+        json.dump(metrics or get_metrics(), f, indent=2)
 
-# Simulate updates to metrics (In a real scenario, these would come from other parts of the system)
-# For demonstration, we'll increment content count as if a new blog post was produced.
-metrics["content_produced"] += 1  # Example increment; in practice, call this when content is created
+def run_goal_report():
+    """Record a produced content piece, save the metrics and log progress against each objective."""
+    # Simulate updates to metrics (In a real scenario, these would come from other parts of the system)
+    # For demonstration, we'll increment content count as if a new blog post was produced.
+    increment_content()  # Example increment; in practice, call this when content is created
 
-# Save updated metrics
-with open(metrics_file, 'w') as f:
-    json.dump(metrics, f, indent=2)
+    metrics = get_metrics()
+    current_month = metrics["month"]
+    export_metrics_json(metrics)
 
-# Compare metrics against objectives and log results
-log_file = os.path.join("logs", "ai_goal_tracker.log")
-with open(log_file, 'a') as logf:
-    logf.write(f"=== Goal Tracking for {current_month} ===\n")
+    # Compare metrics against objectives; build the report in memory and append it with one write
+    buf = io.StringIO()
+    buf.write(f"=== Goal Tracking for {current_month} ===\n")
     # Check each objective
     for obj, target in objectives.items():
         if obj == "monthly_content":
@@ -66,15 +123,22 @@ with open(log_file, 'a') as logf:
         if actual is None:
             continue
 
-        logf.write(f"{desc}: {actual} (Target: {target})\n")
+        buf.write(f"{desc}: {actual} (Target: {target})\n")
         # Determine status
         if actual >= target:
-            logf.write(f"[SUCCESS] {desc} target achieved!\n")
+            buf.write(f"[SUCCESS] {desc} target achieved!\n")
             # (Could trigger a success event or notification here)
         else:
             progress = (actual / target) * 100 if target > 0 else 0
-            logf.write(f"Progress: {progress:.1f}% of target.\n")
+            buf.write(f"Progress: {progress:.1f}% of target.\n")
             if progress < 50:  # less than 50% of target reached
-                logf.write(f"[WARN] {desc} is behind schedule.\n")
+                buf.write(f"[WARN] {desc} is behind schedule.\n")
                 # (Could trigger an anomaly event if severely behind)
-    logf.write("=== End of Report ===\n\n")
+    buf.write("=== End of Report ===\n\n")
+
+    log_file = os.path.join("logs", "ai_goal_tracker.log")
+    with open(log_file, 'a', buffering=1 << 16) as logf:
+        logf.write(buf.getvalue())
+
+if __name__ == "__main__":
+    run_goal_report()
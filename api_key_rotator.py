@@ -1,18 +1,28 @@
 # api_key_rotator.py
-import os, time
+import os, json, time, datetime, atexit
 try:
     import yaml
 except ImportError:
     yaml = None
+from config_loader import load_config, load_rotation_state, ROTATION_STATE_FILE as STATE_FILE
 
 CONFIG_FILE = "spartan_ai_config.yaml"
 LOG_FILE = "logs/api_key_rotator.log"
 
+_log_file = None  # one append handle for the whole run, opened on the first message
+
+def _log(message):
+    """Append a line to the rotator log with an ISO-8601 timestamp (locale-independent, cheaper than ctime)."""
+    global _log_file
+    if _log_file is None:
+        _log_file = open(LOG_FILE, 'a', buffering=4096)
+        atexit.register(_log_file.close)  # flushes the buffered lines, including on exit(0)
+    _log_file.write(f"{datetime.datetime.now().isoformat(timespec='seconds')}: {message}\n")
+
 # Load configuration
 config = {}
 if yaml and os.path.exists(CONFIG_FILE):
-    with open(CONFIG_FILE, 'r') as f:
-        config = yaml.safe_load(f)
+    config = load_config(CONFIG_FILE)
 else:
     # If YAML not available or config missing, exit
     exit(0)
@@ -20,37 +30,33 @@ else:
 enabled = config.get("enable_api_key_rotator", False)
 if not enabled or not config.get("allow_external_api", False):
     # Feature disabled or external API not in use, nothing to do
-    with open(LOG_FILE, 'a') as logf:
-        logf.write(f"{time.ctime()}: API Key Rotator is disabled or not needed (offline mode).\n")
+    _log("API Key Rotator is disabled or not needed (offline mode).")
     exit(0)
 
 api_keys = config.get("api_keys", [])
 current_key = config.get("external_api_key")
 if not api_keys or len(api_keys) < 2:
     # Not enough keys to rotate
-    with open(LOG_FILE, 'a') as logf:
-        logf.write(f"{time.ctime()}: Only one or no API key configured, rotation not applicable.\n")
+    _log("Only one or no API key configured, rotation not applicable.")
     exit(0)
 
-# Determine current key index
-try:
-    current_index = api_keys.index(current_key)
-except ValueError:
-    current_index = -1  # current key not found in list
+# Determine current key index: the rotation state file wins over the key configured in the YAML
+current_index = -1
+state = load_rotation_state()
+if isinstance(state.get("index"), int) and 0 <= state["index"] < len(api_keys):
+    current_index = state["index"]
+else:
+    try:
+        current_index = api_keys.index(current_key)
+    except ValueError:
+        current_index = -1  # current key not found in list
 # Choose the next key in the list
 new_index = (current_index + 1) % len(api_keys) if current_index != -1 else 0
-new_key = api_keys[new_index]
-
-# Update the config with new key
-config["external_api_key"] = new_key
-# Optionally, store the index as well
-config["current_api_key_index"] = new_index
 
-# Save the updated config
-if yaml:
-    with open(CONFIG_FILE, 'w') as f:
-        yaml.safe_dump(config, f)
+# Persist only the rotation state (a few bytes of JSON) instead of re-dumping the whole YAML config,
+# which was slow and dropped its comments and formatting
+with open(STATE_FILE, 'w') as f:
+    json.dump({"index": new_index, "ts": time.time()}, f)
 
 # Log the rotation event
-with open(LOG_FILE, 'a') as logf:
-    logf.write(f"{time.ctime()}: API key rotated to index {new_index}.\n")
+_log(f"API key rotated to index {new_index}.")
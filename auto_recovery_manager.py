@@ -1,20 +1,83 @@
 # auto_recovery_manager.py
 
 import os
+import re
+import sys
 import logging
+import importlib
+import importlib.util
 import subprocess
 
+# A script-style module whose work lives only in its `if __name__ == "__main__":` block (no `main()`)
+# does nothing when imported, so it can only be restarted by running it as a script.
+_MAIN_GUARD_RE = re.compile(r"""^if\s+__name__\s*==\s*['"]__main__['"]\s*:""", re.MULTILINE)
+_MAIN_FUNC_RE = re.compile(r"^def\s+main\s*\(", re.MULTILINE)
+
 class AutoRecoveryManager:
-    def __init__(self):
+    def __init__(self, entry_points=None, isolated_modules=()):
         self.logger = logging.getLogger("AutoRecoveryManager")
+        # Recovery entry points run in-process: {module_name: callable}
+        self._modules = dict(entry_points or {})
+        # Modules that must still be restarted in a separate interpreter
+        self._isolated = set(isolated_modules)
+
+    def register(self, module_name: str, entry_point):
+        """Register an in-process recovery entry point for a module."""
+        self._modules[module_name] = entry_point
 
     def attempt_restart(self, module_name: str):
         self.logger.warning(f"[Recovery] Attempting to restart module: {module_name}")
         try:
-            result = subprocess.run(["python", f"{module_name}.py"], capture_output=True)
-            if result.returncode == 0:
+            if module_name in self._isolated:
+                ok = self._restart_in_subprocess(module_name)
+            else:
+                ok = self._restart_in_process(module_name)
+            if ok:
                 self.logger.info(f"[Recovery] {module_name} restarted successfully.")
             else:
                 self.logger.error(f"[Recovery] Failed to restart {module_name}.")
         except Exception as e:
             self.logger.error(f"[Recovery] Exception while restarting {module_name}: {e}")
+
+    def _restart_in_process(self, module_name: str) -> bool:
+        """Re-run the module (reloading it if already imported) and invoke its entry point.
+        Modules whose work only runs under a `__main__` guard are restarted in a subprocess instead."""
+        try:
+            entry_point = self._modules.get(module_name)
+            if entry_point is None:
+                if self._runs_only_as_script(module_name):
+                    return self._restart_in_subprocess(module_name)
+                module = sys.modules.get(module_name)
+                # Import runs the module body once; reload only re-runs an already imported module
+                module = importlib.reload(module) if module is not None else importlib.import_module(module_name)
+                # Without a main(), re-running the module body (script-style module) is the restart
+                entry_point = getattr(module, "main", None)
+            if callable(entry_point):
+                entry_point()
+        except SystemExit as e:
+            # Script-style modules exit(0) when they have nothing to do
+            return e.code in (None, 0)
+        return True
+
+    @staticmethod
+    def _runs_only_as_script(module_name: str) -> bool:
+        """True if the module's source has a `__main__` guard but no `main()` to call in-process."""
+        spec = importlib.util.find_spec(module_name)
+        origin = spec.origin if spec is not None else None
+        if not origin or not origin.endswith(".py"):
+            return False
+        with open(origin, encoding="utf-8") as f:
+            source = f.read()
+        return _MAIN_GUARD_RE.search(source) is not None and _MAIN_FUNC_RE.search(source) is None
+
+    def _restart_in_subprocess(self, module_name: str) -> bool:
+        # Output is never inspected, so discard it rather than draining capture pipes
+        result = subprocess.run(
+            [sys.executable, f"{module_name}.py"],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            close_fds=True,
+            start_new_session=True,
+            check=False,
+        )
+        return result.returncode == 0
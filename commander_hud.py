@@ -3,7 +3,7 @@
 import streamlit as st
 import time
 
-st.markdown("""
+HUD_CSS = """
 <style>
 #hudBox {
     background-color: #111;
@@ -21,11 +21,20 @@ st.markdown("""
     max-width: 300px;
 }
 </style>
-<div id="hudBox">
+"""
+
+@st.cache_resource
+def _inject_css():
+    # Static stylesheet: built once and replayed from the cache on every rerun
+    st.markdown(HUD_CSS, unsafe_allow_html=True)
+
+_inject_css()
+
+# Only the small dynamic HUD body is re-rendered per rerun
+st.markdown(f"""<div id="hudBox">
     <b>COMMANDER HUD</b><br>
     Status: <span style="color:#0F0">Monitoring</span><br>
-    Last Check: {}</div>
-""".format(time.strftime("%H:%M:%S")), unsafe_allow_html=True)
+    Last Check: {time.strftime("%H:%M:%S")}</div>""", unsafe_allow_html=True)
 
 # Optional: show warning
 if st.session_state.get("override_active"):
@@ -0,0 +1,75 @@
+# config_loader.py
+import os, json, functools
+try:
+    import yaml
+    try:
+        from yaml import CSafeLoader as _Loader  # libyaml C bindings
+    except ImportError:
+        from yaml import SafeLoader as _Loader   # pure-Python fallback
+except ImportError:
+    yaml = None
+
+CONFIG_FILE = "spartan_ai_config.yaml"
+ROTATION_STATE_FILE = "logs/key_rotator_state.json"  # written by api_key_rotator.py
+
+def _cache_path(path):
+    """Sidecar holding the parsed config as JSON, e.g. spartan_ai_config.cache.json."""
+    return os.path.splitext(path)[0] + ".cache.json"
+
+def _has_only_str_keys(value):
+    """True if every mapping nested in value has string keys only.
+    JSON turns other keys (e.g. YAML `1:` or `true:`) into strings, so such a config can't be cached as JSON."""
+    if isinstance(value, dict):
+        return all(isinstance(k, str) and _has_only_str_keys(v) for k, v in value.items())
+    if isinstance(value, list):
+        return all(_has_only_str_keys(v) for v in value)
+    return True
+
+@functools.lru_cache(maxsize=8)
+def _parse_config(path, mtime_ns, size):
+    """Load the config once per (path, mtime, size) stamp.
+    The JSON sidecar is used when its stamp matches the YAML source; otherwise the YAML is parsed
+    and the sidecar rewritten, so only the first load after an edit pays for YAML parsing."""
+    cache_path = _cache_path(path)
+    try:
+        with open(cache_path, 'rb') as f:
+            cached = json.loads(f.read())
+        if cached.get("mtime_ns") == mtime_ns and cached.get("size") == size:
+            return cached["config"]
+    except (OSError, ValueError, KeyError, AttributeError):
+        pass  # missing, unreadable or stale sidecar: fall through to the YAML source
+
+    with open(path, 'r') as f:
+        config = yaml.load(f, Loader=_Loader) or {}
+    if not _has_only_str_keys(config):
+        return config  # a JSON sidecar would not load back as the same dict; always parse the YAML
+    try:
+        tmp_path = cache_path + ".tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump({"mtime_ns": mtime_ns, "size": size, "config": config}, f, separators=(',', ':'))
+        os.replace(tmp_path, cache_path)
+    except (OSError, TypeError, ValueError):
+        pass  # config not JSON-serialisable or directory not writable; the YAML stays authoritative
+    return config
+
+def load_config(path=CONFIG_FILE):
+    """Return the parsed config for path, re-parsing only when the file has changed on disk.
+    The returned dict is shared between callers; modules that edit it should write it back to disk."""
+    st = os.stat(path)
+    return _parse_config(path, st.st_mtime_ns, st.st_size)
+
+def load_rotation_state(path=ROTATION_STATE_FILE):
+    """Return the API key rotator's state ({"index": int, "ts": float}), or {} if it has not run yet."""
+    try:
+        with open(path, 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def active_api_key(config):
+    """Return the external API key currently selected by the rotator, or the configured key if none is."""
+    api_keys = config.get("api_keys") or []
+    index = load_rotation_state().get("index")
+    if isinstance(index, int) and 0 <= index < len(api_keys):
+        return api_keys[index]
+    return config.get("external_api_key")
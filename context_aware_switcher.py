@@ -1,16 +1,20 @@
 # context_aware_switcher.py
-import re
+import os, re
 try:
     import yaml
 except ImportError:
     yaml = None
+from config_loader import load_config
+try:
+    import ahocorasick  # pyahocorasick: single-pass multi-keyword matching for large domain maps
+except ImportError:
+    ahocorasick = None
 
 CONFIG_FILE = "spartan_ai_config.yaml"
 # Load config for agent info and settings
 config = {}
 if yaml and os.path.exists(CONFIG_FILE):
-    with open(CONFIG_FILE, 'r') as f:
-        config = yaml.safe_load(f)
+    config = load_config(CONFIG_FILE)
 
 # Extract necessary info from config
 allow_external = config.get("allow_external_api", False)
@@ -19,51 +23,102 @@ agents = config.get("agents", {})
 domain_map = config.get("domain_map", {})
 urgent_agent = config.get("urgent_agent", None)
 
-def route_prompt(prompt, urgent=False):
-    """Determine which agent should handle the given prompt based on domain and urgency."""
-    prompt_lower = prompt.lower()
+# Flatten per-agent properties once at config load so routing does single dict reads per agent
+_agent_type = {k: v.get("type") for k, v in agents.items()}
+_agent_enabled = {k: v.get("enabled", True) for k, v in agents.items()}
+# Enabled local agents in fallback_order (offline fallback) and in config order (last resort)
+_fallback_local = [k for k in config.get("fallback_order", []) if _agent_type.get(k) == "local" and _agent_enabled.get(k)]
+_enabled_local_agents = [k for k in agents if _agent_enabled[k] and _agent_type[k] == "local"]
+
+# Precompile all domain keywords once at config load. With pyahocorasick installed an Aho-Corasick
+# automaton matches every keyword in one pass regardless of how many there are; otherwise fall back
+# to a single alternation regex (longest first, so longer keywords win on overlap). Both paths yield the
+# same keywords: leftmost match first, and the longest keyword among those starting there.
+_domain_keywords = sorted((k for k in domain_map if k != "default"), key=len, reverse=True)
+_KW_AUTOMATON = None
+_KW_RE = None
+if _domain_keywords and ahocorasick:
+    _KW_AUTOMATON = ahocorasick.Automaton()
+    for _kw in _domain_keywords:
+        _KW_AUTOMATON.add_word(_kw, _kw)
+    _KW_AUTOMATON.make_automaton()
+elif _domain_keywords:
+    _KW_RE = re.compile(r"\b(" + "|".join(re.escape(k) for k in _domain_keywords) + r")\b")
+
+def _is_word_char(ch):
+    return ch.isalnum() or ch == "_"
+
+def _iter_domain_keywords(prompt_lower):
+    """Yield the domain keywords found in the (lowercased) prompt as whole words, in prompt order."""
+    if _KW_AUTOMATON is not None:
+        # The automaton reports hits in order of where they end, so a shorter keyword ending earlier would come
+        # before a longer overlapping one. Collect the whole-word hits and replay them like the regex scans:
+        # leftmost start first, longest keyword at that start, skipping hits that overlap one already taken.
+        hits = []
+        for end, keyword in _KW_AUTOMATON.iter(prompt_lower):
+            start = end - len(keyword) + 1
+            # Emulate \b: the match must not be glued to a word character on either side
+            if start > 0 and _is_word_char(prompt_lower[start - 1]):
+                continue
+            if end + 1 < len(prompt_lower) and _is_word_char(prompt_lower[end + 1]):
+                continue
+            hits.append((start, -len(keyword), keyword))
+        hits.sort()
+        next_free = 0
+        for start, neg_len, keyword in hits:
+            if start >= next_free:
+                next_free = start - neg_len
+                yield keyword
+    elif _KW_RE is not None:
+        # Cheap C-level substring prefilter: skip the regex engine entirely when no keyword occurs at all
+        if not any(k in prompt_lower for k in _domain_keywords):
+            return
+        for match in _KW_RE.finditer(prompt_lower):
+            yield match.group(1)
+
+def route_prompt(prompt, urgent=False, prompt_lower=None):
+    """Determine which agent should handle the given prompt based on domain and urgency.
+    When several domain keywords occur, the one appearing first in the prompt wins (the longest one if
+    keywords overlap there), not the first in domain_map order.
+    Callers routing the same prompt repeatedly can pass its lowercased form as prompt_lower."""
     chosen_agent = None
 
     # If urgent, use the designated urgent agent (if any)
     if urgent and urgent_agent:
         # Ensure urgent agent is enabled and available
-        if urgent_agent in agents and agents[urgent_agent].get("enabled", True):
+        if _agent_enabled.get(urgent_agent, False):
             # If offline mode and urgent agent is external, we may skip it
-            if not offline_mode or agents[urgent_agent]["type"] == "local":
+            if not offline_mode or _agent_type[urgent_agent] == "local":
                 chosen_agent = urgent_agent
 
     # Determine domain from keywords if not urgent or no urgent agent selected
     if chosen_agent is None:
-        for keyword, agent_key in domain_map.items():
-            if re.search(rf"\b{keyword}\b", prompt_lower):
-                if agent_key in agents and agents[agent_key].get("enabled", True):
-                    # If offline and the mapped agent is external, skip to next
-                    if offline_mode and agents[agent_key]["type"] == "external":
-                        continue
-                    chosen_agent = agent_key
-                    break
+        if prompt_lower is None:
+            prompt_lower = prompt.lower()
+        # Single pass over the prompt; each match yields its keyword and mapped agent
+        for keyword in _iter_domain_keywords(prompt_lower):
+            agent_key = domain_map[keyword]
+            if _agent_enabled.get(agent_key, False):
+                # If offline and the mapped agent is external, skip to next
+                if offline_mode and _agent_type[agent_key] == "external":
+                    continue
+                chosen_agent = agent_key
+                break
 
     # Fallback to default if no specific domain match or chosen agent was skipped
     if chosen_agent is None:
         default_agent = domain_map.get("default", None) or (config.get("fallback_order")[0] if config.get("fallback_order") else None)
         if default_agent:
             # If default is external and offline, try next fallback
-            if offline_mode and default_agent in agents and agents[default_agent]["type"] == "external":
-                # Use the first local agent in fallback_order
-                fallback_list = config.get("fallback_order", [])
-                for agent_key in fallback_list:
-                    if agent_key in agents and agents[agent_key]["type"] == "local" and agents[agent_key].get("enabled", True):
-                        chosen_agent = agent_key
-                        break
+            if offline_mode and _agent_type.get(default_agent) == "external":
+                # Use the first enabled local agent in fallback_order
+                chosen_agent = next(iter(_fallback_local), None)
             else:
                 chosen_agent = default_agent
 
     # Final safety: if chosen agent still None, pick any enabled local agent
     if chosen_agent is None:
-        for agent_key, props in agents.items():
-            if props.get("enabled", True) and props.get("type") == "local":
-                chosen_agent = agent_key
-                break
+        chosen_agent = next(iter(_enabled_local_agents), None)
 
     # At this point, chosen_agent is the key of the agent to handle the prompt
     return chosen_agent
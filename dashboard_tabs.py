@@ -18,8 +18,15 @@ def register_tabs():
     st.session_state["active_tab"] = tab
     return tab
 
-controls = CommanderControls()
-active_tab = register_tabs()
+def render_dashboard():
+    """Render the sidebar controls and tab selector. Kept out of module scope so importing TABS draws no widgets."""
+    controls = CommanderControls()
+    active_tab = register_tabs()
 
-if controls.show_debug_controls():
-    st.warning("Debug simulation enabled.")
+    if controls.show_debug_controls():
+        st.warning("Debug simulation enabled.")
+    return active_tab
+
+# `streamlit run dashboard_tabs.py` executes this file as __main__
+if __name__ == "__main__":
+    render_dashboard()
@@ -4,13 +4,36 @@ import streamlit as st
 import os
 
 LOG_PATH = "logs"
+TAIL_LINES = 200          # limit view to last 200 lines
+TAIL_CHUNK = 64 * 1024    # bytes read per step when scanning back from the end
+
+def _tail_lines(path, num_lines=TAIL_LINES):
+    """Return the last num_lines lines of a file, reading backwards from the end in fixed-size chunks."""
+    with open(path, "rb") as f:
+        f.seek(0, os.SEEK_END)
+        pos = f.tell()
+        data = b""
+        # Keep reading earlier chunks until we have enough complete lines or reach the start of the file
+        while pos > 0 and data.count(b"\n") <= num_lines:
+            step = min(TAIL_CHUNK, pos)
+            pos -= step
+            f.seek(pos)
+            data = f.read(step) + data
+    lines = data.decode("utf-8", errors="replace").splitlines(keepends=True)
+    if pos > 0:
+        lines = lines[1:]  # first line may be cut off mid-way
+    return lines[-num_lines:]
+
+@st.cache_data(ttl=5)
+def _list_logs():
+    """List .log files in LOG_PATH; cached briefly so Streamlit reruns don't rescan the directory."""
+    return [e.name for e in os.scandir(LOG_PATH) if e.is_file() and e.name.endswith(".log")]
 
 st.title("📋 Full System Log Viewer")
 
-selected_file = st.selectbox("Select log file", [f for f in os.listdir(LOG_PATH) if f.endswith(".log")])
+selected_file = st.selectbox("Select log file", _list_logs())
 
 if selected_file:
     st.subheader(f"📄 Viewing: {selected_file}")
-    with open(os.path.join(LOG_PATH, selected_file), "r") as f:
-        lines = f.readlines()[-200:]  # limit view to last 200 lines
-        st.text("".join(lines))
+    lines = _tail_lines(os.path.join(LOG_PATH, selected_file))
+    st.text("".join(lines))
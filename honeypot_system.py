@@ -14,10 +14,10 @@ honeypot_patterns = [
 enabled = False  # This should be set based on config, but default to False here
 try:
     import yaml
+    from config_loader import load_config
     CONFIG_FILE = "spartan_ai_config.yaml"
     if os.path.exists(CONFIG_FILE):
-        with open(CONFIG_FILE, 'r') as f:
-            config = yaml.safe_load(f)
+        config = load_config(CONFIG_FILE)
         enabled = config.get("enable_honeypot_system", False)
 except ImportError:
     # If YAML not available, assume disabled unless told otherwise
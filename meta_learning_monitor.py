@@ -5,6 +5,7 @@ try:
     import yaml
 except ImportError:
     yaml = None
+from config_loader import load_config
 
 CONFIG_FILE = "spartan_ai_config.yaml"
 LOG_DIR = "logs"
@@ -14,8 +15,7 @@ diag_log_file = os.path.join(LOG_DIR, "spartan_diagnostics.log")
 # Load current config
 config = {}
 if os.path.exists(CONFIG_FILE) and yaml:
-    with open(CONFIG_FILE, 'r') as f:
-        config = yaml.safe_load(f)
+    config = load_config(CONFIG_FILE)
 
 # Analyze agent performance from scorecard log (if available)
 agent_performance = {}  # {agent: success_rate}
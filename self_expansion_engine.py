@@ -4,6 +4,7 @@ try:
     import yaml
 except ImportError:
     yaml = None
+from config_loader import load_config, active_api_key
 
 CONFIG_FILE = "spartan_ai_config.yaml"
 LOG_FILE = "logs/self_expansion_engine.log"
@@ -12,8 +13,7 @@ LOG_FILE = "logs/self_expansion_engine.log"
 enabled = False
 config = {}
 if yaml and os.path.exists(CONFIG_FILE):
-    with open(CONFIG_FILE, 'r') as f:
-        config = yaml.safe_load(f)
+    config = load_config(CONFIG_FILE)
     enabled = config.get("enable_self_expansion_engine", False)
 
 if not enabled:
@@ -46,9 +46,10 @@ if yaml and "agents" in config and "domain_map" in config:
             opportunities.append(f"Create new agent for domain: {domain}")
 
 # 2. If GPT API is allowed, use it to generate suggestions (optional and offline by default)
-if config.get("allow_external_api", False) and config.get("external_api_key"):
+api_key = active_api_key(config)  # honours the API key rotator's current selection
+if config.get("allow_external_api", False) and api_key:
     import openai
-    openai.api_key = config["external_api_key"]
+    openai.api_key = api_key
     try:
         response = openai.Completion.create(
             engine="text-davinci-003",
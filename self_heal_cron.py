@@ -4,6 +4,7 @@ try:
     import yaml
 except ImportError:
     yaml = None
+from config_loader import load_config
 
 CONFIG_FILE = "spartan_ai_config.yaml"
 LOG_DIR = "logs"
@@ -18,8 +19,7 @@ def log(message):
 # Load config to get any necessary parameters
 config = {}
 if os.path.exists(CONFIG_FILE) and yaml:
-    with open(CONFIG_FILE, 'r') as f:
-        config = yaml.safe_load(f)
+    config = load_config(CONFIG_FILE)
 
 log("=== Self-Healing Cron Job Started ===")
 
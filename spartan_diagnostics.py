@@ -5,14 +5,14 @@ try:
     import yaml
 except ImportError:
     yaml = None  # handle case where PyYAML isn't installed
+from config_loader import load_config
 
 # Load global config
 config_path = "spartan_ai_config.yaml"
 if not os.path.exists(config_path):
     print("[ERROR] Global config file missing!")
     exit(1)
-with open(config_path, 'r') as f:
-    config = yaml.safe_load(f) if yaml else {}  # use yaml if available
+config = load_config(config_path) if yaml else {}  # use yaml if available
 
 # Ensure logs directory exists for logging
 log_dir = config.get("log_dir", "logs")